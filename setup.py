@@ -2,6 +2,7 @@ import os
 import platform
 import shutil
 import subprocess
+import sys
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
@@ -16,6 +17,11 @@ _PATTERNS: dict[str, str] = {
     "Darwin": "liblsl*.dylib",
     "Windows": "lsl*.dll",
 }
+_SYSTEM: str = platform.system()
+_LIB_PATTERN: str = _PATTERNS[_SYSTEM]
+_IS_WINDOWS: bool = _SYSTEM == "Windows"
+_IS_DARWIN: bool = _SYSTEM == "Darwin"
+_HERE: Path = Path(__file__).resolve().parent
 
 
 class BinaryDistribution(Distribution):  # noqa: D101
@@ -31,70 +37,176 @@ class build_ext(_build_ext):  # noqa: D101
         if skip:
             print("Skipping build of liblsl.")  # noqa: T201
             return
-        src = Path(__file__).parent / "src" / "liblsl"
-        assert src.exists()  # sanity-check
-        with TemporaryDirectory() as build_dir:
-            args = [
+        prebuilt = os.environ.get("MNE_LSL_PREBUILT_LIBLSL_DIR")
+        if prebuilt is not None:
+            # reuse a library built once per platform, e.g. shared between CI jobs
+            lib_files = [
+                elt for elt in Path(prebuilt).glob(_LIB_PATTERN) if not elt.is_symlink()
+            ]
+            if len(lib_files) != 1:
+                raise RuntimeError(
+                    f"Expected one liblsl matching '{_LIB_PATTERN}' in "
+                    f"MNE_LSL_PREBUILT_LIBLSL_DIR '{prebuilt}', found {lib_files}."
+                )
+            self._copy_lib(lib_files[0])
+            super().run()
+            return
+        if self._liblsl_up_to_date():
+            print("liblsl is up to date, skipping build.")  # noqa: T201
+            super().run()
+            return
+        build_dir = os.environ.get("MNE_LSL_LIBLSL_BUILD_DIR")
+        if build_dir is not None:
+            # persistent build tree, incremental rebuilds skip unchanged objects
+            Path(build_dir).mkdir(parents=True, exist_ok=True)
+            self._build_liblsl(build_dir)
+        else:
+            with TemporaryDirectory() as temp_build_dir:
+                self._build_liblsl(temp_build_dir)
+        super().run()
+
+    @staticmethod
+    def _run_cmake(args, build_dir, env=None):
+        """Run a cmake command and surface its stderr tail on failure."""
+        result = subprocess.run(args, stderr=subprocess.PIPE, text=True, env=env)
+        if result.stderr:
+            sys.stderr.write(result.stderr)
+        if result.returncode != 0:
+            tail = "\n".join(result.stderr.splitlines()[-50:])
+            raise RuntimeError(
+                f"The command {' '.join(args)} failed with exit code "
+                f"{result.returncode}. Set MNE_LSL_LIBLSL_BUILD_DIR to preserve "
+                f"'{build_dir}' for inspection.\n{tail}"
+            )
+
+    def _copy_lib(self, lib_file):
+        """Copy the liblsl artifact into the package or build tree."""
+        dst = (
+            _HERE / "src" / "mne_lsl" / "lsl" / "lib"
+            if self.inplace
+            else Path(self.build_lib) / "mne_lsl" / "lsl" / "lib"
+        )
+        dst.mkdir(parents=True, exist_ok=True)
+        print(f"Copying {lib_file} to {dst / lib_file.name}")  # noqa: T201
+        shutil.copyfile(lib_file, dst / lib_file.name)
+
+    def _liblsl_up_to_date(self):
+        """Check if the library in the package tree is newer than its sources."""
+        if not self.inplace:
+            return False  # always build into a fresh build_lib
+        if os.environ.get("MNE_LSL_LIBLSL_BUILD_UNITTESTS"):
+            return False  # unit test binaries are never kept in the package tree
+        if os.environ.get("MNE_LSL_NATIVE_OPT"):
+            return False  # the flag changes the desired artifact, always rebuild
+        dst = _HERE / "src" / "mne_lsl" / "lsl" / "lib"
+        lib = next(dst.glob(_LIB_PATTERN), None)
+        if lib is None:
+            return False
+        src = _HERE / "src" / "liblsl"
+        newest_src = max(
+            (elt.stat().st_mtime for elt in src.rglob("*") if elt.is_file()),
+            default=None,
+        )
+        return newest_src is not None and newest_src <= lib.stat().st_mtime
+
+    def _build_liblsl(self, build_dir):
+        """Configure and build 'liblsl' in 'build_dir' with cmake."""
+        src = _HERE / "src" / "liblsl"
+        if not src.exists():
+            raise RuntimeError(
+                f"The liblsl sources are missing from '{src}'. If building from "
+                "a git checkout, run 'git submodule update --init'."
+            )
+        args = [
+            "cmake",
+            "-S",
+            str(src),
+            "-B",
+            build_dir,
+            "-DCMAKE_BUILD_TYPE=Release",
+        ]
+        # prefer Ninja over the platform default generator (Unix Makefiles or
+        # MSBuild) when available, for faster configure and build steps
+        uses_ninja = shutil.which("ninja") is not None
+        if uses_ninja:
+            args.extend(["-G", "Ninja"])
+        if _IS_DARWIN:
+            args.append("-DCMAKE_OSX_DEPLOYMENT_TARGET=11")
+        native_opt = os.environ.get("MNE_LSL_NATIVE_OPT")
+        native_opt = eval(native_opt) if native_opt is not None else False
+        if native_opt:
+            # opt-in for source installs only, the resulting binary is not portable
+            args.append("-DCMAKE_INTERPROCEDURAL_OPTIMIZATION=ON")
+            if not _IS_WINDOWS:
+                args.append("-DCMAKE_C_FLAGS=-march=native -O3")
+                args.append("-DCMAKE_CXX_FLAGS=-march=native -O3")
+        unit_tests = os.environ.get("MNE_LSL_LIBLSL_BUILD_UNITTESTS")
+        unit_tests = eval(unit_tests) if unit_tests is not None else False
+        if unit_tests:
+            args.append("-DLSL_UNITTESTS=ON")
+        env = None
+        if shutil.which("ccache") is not None:
+            # reuse compiled objects across build directories and CI jobs
+            args.append("-DCMAKE_C_COMPILER_LAUNCHER=ccache")
+            args.append("-DCMAKE_CXX_COMPILER_LAUNCHER=ccache")
+            env = {**os.environ, "CCACHE_BASEDIR": str(_HERE)}
+        self._run_cmake(args, build_dir, env)
+        jobs = os.environ.get("CMAKE_BUILD_PARALLEL_LEVEL") or str(os.cpu_count() or 2)
+        self._run_cmake(
+            [
                 "cmake",
-                "-S",
-                str(src),
-                "-B",
+                "--build",
                 build_dir,
-                "-DCMAKE_BUILD_TYPE=Release",
-            ]
-            if platform.system() == "Darwin":
-                args.append("-DCMAKE_OSX_DEPLOYMENT_TARGET=11")
-            unit_tests = os.environ.get("MNE_LSL_LIBLSL_BUILD_UNITTESTS")
-            unit_tests = eval(unit_tests) if unit_tests is not None else False
-            if unit_tests:
-                args.append("-DLSL_UNITTESTS=ON")
-            subprocess.run(args, check=True)
+                "--config",
+                "Release",
+                "--parallel",
+                jobs,
+            ],
+            build_dir,
+            env,
+        )
+        # locate the build files and move them to mne_lsl.lsl.lib, Ninja is a
+        # single-config generator and does not nest artifacts per configuration
+        if _IS_WINDOWS and not uses_ninja:
+            build_dir = Path(build_dir) / "Release"
+        else:
+            build_dir = Path(build_dir)
+        lib_files = [
+            elt for elt in build_dir.glob(_LIB_PATTERN) if not elt.is_symlink()
+        ]
+        if len(lib_files) != 1:
+            raise RuntimeError(
+                f"Expected one liblsl matching '{_LIB_PATTERN}' in the build "
+                f"directory '{build_dir}', found {lib_files}."
+            )
+        if not _IS_WINDOWS and shutil.which("strip") is not None:
+            # drop debug and local symbols to shrink the shipped binary
             subprocess.run(
-                ["cmake", "--build", build_dir, "--config", "Release"], check=True
+                ["strip", "-x" if _IS_DARWIN else "--strip-unneeded", lib_files[0]],
+                check=False,
             )
-            # locate the build files and move them to mne_lsl.lsl.lib
-            if platform.system() == "Windows":
-                build_dir = Path(build_dir) / "Release"
+        self._copy_lib(lib_files[0])
+        # move unit test files if they were produced
+        if unit_tests:
+            if _IS_WINDOWS and not uses_ninja:
+                test_build_dir = build_dir.parent / "testing" / "Release"
             else:
-                build_dir = Path(build_dir)
-            lib_files = [
-                elt
-                for elt in build_dir.glob(_PATTERNS[platform.system()])
-                if not elt.is_symlink()
-            ]
-            assert len(lib_files) == 1  # sanity-check
-            dst = (
-                Path(__file__).parent / "src" / "mne_lsl" / "lsl" / "lib"
-                if self.inplace
-                else Path(self.build_lib) / "mne_lsl" / "lsl" / "lib"
-            )
+                test_build_dir = build_dir / "testing"
+            test_files = [elt for elt in test_build_dir.glob("lsl_test*")]
+            if len(test_files) == 0:
+                raise RuntimeError(
+                    "The LIBLSL unit tests were requested but not found in the "
+                    "build artifacts."
+                )
+            dst = _HERE / "tests" / "liblsl"
             dst.mkdir(parents=True, exist_ok=True)
-            print(f"Copying {lib_files[0]} to {dst / lib_files[0].name}")  # noqa: T201
-            shutil.copyfile(lib_files[0], dst / lib_files[0].name)
-            # move unit test files if they were produced
-            if unit_tests:
-                if platform.system() == "Windows":
-                    test_build_dir = build_dir.parent / "testing" / "Release"
-                else:
-                    test_build_dir = build_dir / "testing"
-                test_files = [elt for elt in test_build_dir.glob("lsl_test*")]
-                if len(test_files) == 0:
-                    raise RuntimeError(
-                        "The LIBLSL unit tests were requested but not found in the "
-                        "build artifacts."
-                    )
-                dst = Path(__file__).parent / "tests" / "liblsl"
-                dst.mkdir(parents=True, exist_ok=True)
-                for test_file in test_files:
-                    print(f"Moving {test_file} to {dst / test_file.name}")  # noqa: T201
-                    shutil.move(test_file, dst / test_file.name)
-                # also copy the liblsl files in the test directory
-                for lib_file in build_dir.glob(_PATTERNS[platform.system()]):
-                    print(f"Copying {lib_file} to {dst / lib_file.name}")  # noqa: T201
-                    shutil.copyfile(
-                        lib_file, dst / lib_file.name, follow_symlinks=False
-                    )
-        super().run()
+            for test_file in test_files:
+                print(f"Moving {test_file} to {dst / test_file.name}")  # noqa: T201
+                shutil.move(test_file, dst / test_file.name)
+            # also copy the liblsl files in the test directory
+            for lib_file in build_dir.glob(_LIB_PATTERN):
+                print(f"Copying {lib_file} to {dst / lib_file.name}")  # noqa: T201
+                shutil.copyfile(lib_file, dst / lib_file.name, follow_symlinks=False)
 
 
 class develop(_develop):  # noqa: D101
@@ -66,7 +66,7 @@ class BasePlayer(ABC, ContainsMixin, SetChannelsMixin):
                 f"{self._chunk_size} is invalid."
             )
         self._n_repeat = (
-            n_repeat if n_repeat is np.inf else ensure_int(n_repeat, "n_repeat")
+            n_repeat if n_repeat == np.inf else ensure_int(n_repeat, "n_repeat")
         )
         if self._n_repeat <= 0:
             raise ValueError(
@@ -283,10 +283,10 @@ class BasePlayer(ABC, ContainsMixin, SetChannelsMixin):
         ch_units_after = np.array(
             [ch["unit_mul"] for ch in self.info["chs"]], dtype=np.int8
         )
-        # re-scale channels
-        factors = ch_units_before - ch_units_after
+        # re-scale channels in-place, one broadcast multiply per channel row
+        factors = np.power(10.0, ch_units_before - ch_units_after)
         self._raw.apply_function(
-            lambda x: (x.T * np.power(np.ones(factors.shape) * 10, factors)).T,
+            lambda x: np.multiply(x, factors[:, np.newaxis], out=x),
             channel_wise=False,
             picks="all",
         )
@@ -345,7 +345,9 @@ class BasePlayer(ABC, ContainsMixin, SetChannelsMixin):
     def _stream(self) -> None:  # pragma: no cover
         """Push a chunk of data from the raw object to the real-time stream.
 
-        Don't use raw.get_data but indexing which is faster.
+        Don't use raw.get_data or raw indexing in the streaming loop, but slice the
+        buffer preconverted at the start of the streaming, which yields a push-ready
+        view.
 
         >>> [In] %timeit raw[:, 0:16][0]
         >>> 19 µs ± 50.3 ns per loo
@@ -353,6 +355,8 @@ class BasePlayer(ABC, ContainsMixin, SetChannelsMixin):
         >>> 1.3 ms ± 1.01 µs per loop
         >>> [In] %timeit np.ascontiguousarray(raw[:, 0:16][0].T)
         >>> 23.7 µs ± 183 ns per loop
+        >>> [In] %timeit buffer[0:16]
+        >>> 102 ns ± 0.33 ns per loop
         """
 
     def _reset_variables(self) -> None:
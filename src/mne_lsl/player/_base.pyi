@@ -53,6 +53,8 @@ class BasePlayer(ABC, ContainsMixin, SetChannelsMixin):
         chunk_size: int = 10,
         n_repeat: int | float = ...,
     ): ...
+    @verbose
+    @fill_doc
     def anonymize(
         self,
         daysback: int | None = None,
@@ -69,12 +71,16 @@ class BasePlayer(ABC, ContainsMixin, SetChannelsMixin):
             If ``None`` (default), the acquisition date, ``info['meas_date']``,
             will be set to ``January 1ˢᵗ, 2000``. This parameter is ignored if
             ``info['meas_date']`` is ``None`` (i.e., no acquisition date has been set).
-        keep_his : bool
-            If ``True``, ``his_id`` of ``subject_info`` will **not** be overwritten.
-            Defaults to ``False``.
-
-            .. warning:: This could mean that ``info`` is not fully
-                         anonymized. Use with caution.
+        keep_his : bool | "his_id" | "sex" | "hand" | sequence of {"his_id", "sex", "hand"}
+            If ``True``, ``his_id``, ``sex``, and ``hand`` of ``subject_info`` will **not** be
+            overwritten. If ``False``, these fields will be anonymized. If ``"his_id"``,
+            ``"sex"``, or ``"hand"`` (or any combination thereof in a sequence), only those
+            fields will **not** be anonymized. Defaults to ``False``.
+
+            .. warning:: Setting ``keep_his`` to anything other than ``False`` may result in
+                         ``info`` not being fully anonymized. Use with caution.
+            .. versionchanged:: MNE  1.12
+               Added support for sequence of ``str``.
         verbose : int | str | bool | None
             Sets the verbosity level. The verbosity increases gradually between
             ``"CRITICAL"``, ``"ERROR"``, ``"WARNING"``, ``"INFO"`` and ``"DEBUG"``.
@@ -95,8 +101,9 @@ class BasePlayer(ABC, ContainsMixin, SetChannelsMixin):
         - meas_date, file_id, meas_id
                 A default value, or as specified by ``daysback``.
         - subject_info
-                Default values, except for 'birthday' which is adjusted
-                to maintain the subject age.
+                Default values, except for 'birthday', which is adjusted to maintain the subject
+                age. If ``keep_his`` is not ``False``, then the fields 'his_id', 'sex', and
+                'hand' are not anonymized, depending on the value of ``keep_his``.
         - experimenter, proj_name, description
                 Default strings.
         - utc_offset
@@ -114,8 +121,9 @@ class BasePlayer(ABC, ContainsMixin, SetChannelsMixin):
         Operates in place.
         """
 
+    @fill_doc
     def get_channel_units(
-        self, picks: Incomplete | None = None, only_data_chs: bool = False
+        self, picks=None, only_data_chs: bool = False
     ) -> list[tuple[int, int]]:
         """Get a list of channel unit for each channel.
 
@@ -127,9 +135,9 @@ class BasePlayer(ABC, ContainsMixin, SetChannelsMixin):
             'eeg']``) will pick channels of those types, channel *name* strings (e.g.,
             ``['MEG0111', 'MEG2623']`` will pick the given channels. Can also be the
             string values ``'all'`` to pick all channels, or ``'data'`` to pick
-            :term:`data channels`. None (default) will pick all channels. Note that
-            channels in ``info['bads']`` *will be included* if their names or indices
-            are explicitly provided.
+            :term:`data channels`. None (default) will pick all channels. Bad channels
+            are included by default. Note that channels in ``info['bads']`` *will be
+            included* if their names or indices are explicitly provided.
         only_data_chs : bool
             Whether to ignore non-data channels. Default is ``False``.
 
@@ -143,6 +151,8 @@ class BasePlayer(ABC, ContainsMixin, SetChannelsMixin):
         """
 
     @abstractmethod
+    @verbose
+    @fill_doc
     def rename_channels(
         self,
         mapping: dict[str, str] | Callable,
@@ -180,6 +190,8 @@ class BasePlayer(ABC, ContainsMixin, SetChannelsMixin):
         """Start streaming data."""
 
     @abstractmethod
+    @verbose
+    @fill_doc
     def set_channel_types(
         self,
         mapping: dict[str, str],
@@ -284,7 +296,9 @@ class BasePlayer(ABC, ContainsMixin, SetChannelsMixin):
     def _stream(self) -> None:
         """Push a chunk of data from the raw object to the real-time stream.
 
-        Don't use raw.get_data but indexing which is faster.
+        Don't use raw.get_data or raw indexing in the streaming loop, but slice the
+        buffer preconverted at the start of the streaming, which yields a push-ready
+        view.
 
         >>> [In] %timeit raw[:, 0:16][0]
         >>> 19 µs ± 50.3 ns per loo
@@ -292,6 +306,8 @@ class BasePlayer(ABC, ContainsMixin, SetChannelsMixin):
         >>> 1.3 ms ± 1.01 µs per loop
         >>> [In] %timeit np.ascontiguousarray(raw[:, 0:16][0].T)
         >>> 23.7 µs ± 183 ns per loop
+        >>> [In] %timeit buffer[0:16]
+        >>> 102 ns ± 0.33 ns per loop
         """
     _end_streaming: bool
     _n_repeated: int
@@ -20,6 +20,8 @@ if TYPE_CHECKING:
 
     from mne.io import BaseRaw
 
+    from .._typing import ScalarFloatArray
+
 
 @fill_doc
 class PlayerLSL(BasePlayer):
@@ -189,6 +191,15 @@ class PlayerLSL(BasePlayer):
         self._outlet_annotations = (
             StreamOutlet(self._sinfo_annotations, 1) if self._annotations else None
         )
+        # convert the raw buffer once to a push-ready C-contiguous array of shape
+        # (n_samples, n_channels), matching the shape and dtype expected by
+        # StreamOutlet.push_chunk. Each chunk sliced from this buffer is thus a
+        # zero-copy view handed directly to liblsl, instead of paying the MNE
+        # indexing and the contiguity copy on every push. Raw objects which are not
+        # preloaded, e.g. memory-mapped recordings, are sliced lazily instead.
+        self._stream_buffer = (
+            np.ascontiguousarray(self._raw._data.T) if self._raw.preload else None
+        )
         self._streaming_delay = self.chunk_size / self.info["sfreq"]
         self._target_timestamp = local_clock()
         self._executor.submit(self._stream)
@@ -254,19 +265,21 @@ class PlayerLSL(BasePlayer):
                 logger.debug("First _stream ping %s", self._name)
             stop = start + self._chunk_size
             if stop <= self._raw.times.size:
-                data = self._raw[:, start:stop][0].T
+                data = self._stream_chunk(start, stop)
                 self._start_idx += self._chunk_size
             elif self._raw.times.size < stop and self._n_repeated < self._n_repeat:
                 logger.debug("End of file reached, looping back to the beginning.")
                 stop %= self._raw.times.size
                 start %= self._raw.times.size  # handle start == self._raw.times.size
-                data = np.vstack([self._raw[:, start:][0].T, self._raw[:, :stop][0].T])
+                data = np.vstack(
+                    [self._stream_chunk(start, None), self._stream_chunk(0, stop)]
+                )
                 self._start_idx = stop
                 self._n_repeated += 1
             else:
                 logger.debug("End of file reached, stopping the player.")
                 stop = self._raw.times.size
-                data = self._raw[:, start:stop][0].T
+                data = self._stream_chunk(start, stop)
                 self._end_streaming = True
                 if data.size == 0:  # pragma: no cover
                     # rare condition where if chunk_size is equal to 1, the last chunk
@@ -318,6 +331,12 @@ class PlayerLSL(BasePlayer):
             except RuntimeError:  # pragma: no cover
                 pass  # shutdown
 
+    def _stream_chunk(self, start: int, stop: int | None) -> ScalarFloatArray:
+        """Retrieve the samples in [start:stop) as an (n_samples, n_channels) array."""
+        if self._stream_buffer is not None:
+            return self._stream_buffer[start:stop]
+        return self._raw[:, start:stop][0].T  # lazy read for non-preloaded raws
+
     def _stream_annotations(
         self, start: int, stop: int, start_timestamp: float
     ) -> None:
@@ -369,6 +388,7 @@ class PlayerLSL(BasePlayer):
         super()._reset_variables()
         self._outlet = None
         self._outlet_annotations = None
+        self._stream_buffer = None
         self._target_timestamp = None
 
     # ----------------------------------------------------------------------------------
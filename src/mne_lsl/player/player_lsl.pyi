@@ -5,6 +5,7 @@ from _typeshed import Incomplete
 from mne import Annotations
 from mne.io import BaseRaw
 
+from .._typing import ScalarFloatArray as ScalarFloatArray
 from ..lsl import StreamInfo as StreamInfo
 from ..lsl import StreamOutlet as StreamOutlet
 from ..lsl import local_clock as local_clock
@@ -147,6 +148,7 @@ class PlayerLSL(BasePlayer):
         """
     _outlet: Incomplete
     _outlet_annotations: Incomplete
+    _stream_buffer: Incomplete
     _streaming_delay: Incomplete
     _target_timestamp: Incomplete
 
@@ -244,7 +246,9 @@ class PlayerLSL(BasePlayer):
     def _stream(self) -> None:
         """Push a chunk of data from the raw object to the real-time stream.
 
-        Don't use raw.get_data but indexing which is faster.
+        Don't use raw.get_data or raw indexing in the streaming loop, but slice the
+        buffer preconverted at the start of the streaming, which yields a push-ready
+        view.
 
         >>> [In] %timeit raw[:, 0:16][0]
         >>> 19 µs ± 50.3 ns per loo
@@ -252,8 +256,13 @@ class PlayerLSL(BasePlayer):
         >>> 1.3 ms ± 1.01 µs per loop
         >>> [In] %timeit np.ascontiguousarray(raw[:, 0:16][0].T)
         >>> 23.7 µs ± 183 ns per loop
+        >>> [In] %timeit buffer[0:16]
+        >>> 102 ns ± 0.33 ns per loop
         """
 
+    def _stream_chunk(self, start: int, stop: int | None) -> ScalarFloatArray:
+        """Retrieve the samples in [start:stop) as an (n_samples, n_channels) array."""
+
     def _stream_annotations(
         self, start: int, stop: int, start_timestamp: float
     ) -> None:
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
 import os
-from concurrent.futures import ThreadPoolExecutor
 from math import ceil
+from threading import Event, Thread
 from typing import TYPE_CHECKING
 
 import numpy as np
@@ -23,7 +23,6 @@ else:
 from ..utils._checks import check_type, check_value, ensure_int
 from ..utils._docs import fill_doc
 from ..utils._fixes import find_events
-from ..utils._time import high_precision_sleep
 from ..utils.logs import logger, warn
 from .base import BaseStream
 
@@ -258,13 +257,16 @@ class EpochsStream:
         """
         self._check_connected("acquire")
         if (
-            self._executor is not None and self._acquisition_delay is None
+            self._acquisition_thread is not None and self._acquisition_delay is None
         ):  # pragma: no cover
             raise RuntimeError(
-                "The executor is not None despite the acquisition delay set to None. "
-                "This should not happen, please contact the developers on GitHub."
+                "The acquisition thread is not None despite the acquisition delay set "
+                "to None. This should not happen, please contact the developers on "
+                "GitHub."
             )
-        elif self._executor is not None and self._acquisition_delay is not None:
+        elif (
+            self._acquisition_thread is not None and self._acquisition_delay is not None
+        ):
             raise RuntimeError(
                 "Acquisition is done automatically in a background thread. The method "
                 "epochs.acquire() should not be called."
@@ -326,24 +328,69 @@ class EpochsStream:
         self._info = pick_info(self._stream._info, self._picks)
         self._tmin_shift = round(self._tmin * self._info["sfreq"])
         self._ch_idx_by_type = channel_indices_by_type(self._info)
+        # resolve the baseline and rejection time windows into sample slices once,
+        # they are fully determined by tmin/tmax and the sampling rate.
+        if self._baseline is None:
+            self._baseline_time = None
+        else:
+            imin = (
+                None
+                if self._baseline[0] is None
+                else np.nonzero(self._baseline[0] <= self._times)[0][0]
+            )
+            imax = (
+                None
+                if self._baseline[1] is None
+                else np.nonzero(self._times <= self._baseline[1])[0][-1]
+            )
+            self._baseline_time = slice(imin, imax)
+        imin = (
+            None
+            if self._reject_tmin is None
+            else np.nonzero(self._reject_tmin <= self._times)[0][0]
+        )
+        imax = (
+            None
+            if self._reject_tmax is None
+            else np.nonzero(self._times <= self._reject_tmax)[0][-1]
+        )
+        self._reject_time = slice(imin, imax)
+        # resolve the event channel picks once, the channels can not be modified while
+        # the stream(s) are marked as epoched.
+        if self._event_stream is None:
+            self._picks_events = _picks_to_idx(
+                self._stream._info, self._event_channels, exclude="bads"
+            )
+        else:
+            self._picks_events = _picks_to_idx(
+                self._event_stream._info, self._event_channels, none="all", exclude=()
+            )
+        # cache the event IDs as an array for the vectorized membership test
+        self._event_id_values = (
+            None
+            if self._event_id is None
+            else np.fromiter(self._event_id.values(), dtype=np.int64)
+        )
         self._buffer = np.zeros(
             (
                 self._bufsize,
-                self._times.size,
                 self._picks.size,
+                self._times.size,
             ),
             dtype=self._stream._buffer.dtype,
         )
         self._buffer_events = np.zeros(self._bufsize, dtype=np.int16)
-        self._executor = (
-            None
-            if self._acquisition_delay is None
-            else ThreadPoolExecutor(max_workers=1)
-        )
-        # submit the first acquisition job
-        if self._executor is not None:
-            logger.debug("%s: ThreadPoolExecutor started.", self)
-            self._executor.submit(self._acquire)
+        # scratch array reused across acquisitions to gather the new epochs, sized to
+        # the maximum number of epochs which can be written in one acquisition.
+        self._scratch = np.empty_like(self._buffer)
+        # start the acquisition loop on a dedicated background thread
+        if self._acquisition_delay is not None:
+            self._stop_acquisition = Event()
+            self._acquisition_thread = Thread(
+                target=self._acquisition_loop, daemon=True
+            )
+            self._acquisition_thread.start()
+            logger.debug("%s: acquisition thread started.", self)
         return self
 
     def disconnect(self) -> EpochsStream:
@@ -370,8 +417,13 @@ class EpochsStream:
         if not self.connected:
             logger.info("The EpochsStream %s is already disconnected. Skipping.", self)
             return
-        if hasattr(self, "_executor") and self._executor is not None:
-            self._executor.shutdown(wait=True, cancel_futures=True)
+        if hasattr(self, "_stop_acquisition") and self._stop_acquisition is not None:
+            self._stop_acquisition.set()
+        if (
+            hasattr(self, "_acquisition_thread")
+            and self._acquisition_thread is not None
+        ):
+            self._acquisition_thread.join()
         self._reset_variables()
         return self
 
@@ -418,7 +470,17 @@ class EpochsStream:
                 )
                 n_epochs = self._buffer.shape[0]
             self._n_new_epochs = 0  # reset the number of new epochs
-            return np.transpose(self._buffer[-n_epochs:, :, picks], axes=(0, 2, 1))
+            # reorder the circular buffer, oldest to newest, and select the last epochs
+            idx = (
+                self._buffer_idx
+                + np.arange(self._buffer.shape[0] - n_epochs, self._buffer.shape[0])
+            ) % self._buffer.shape[0]
+            data = self._buffer[idx]
+            if picks.size != data.shape[1] or not np.array_equal(
+                picks, np.arange(data.shape[1])
+            ):  # skip the fancy-indexed copy when all channels are selected
+                data = data[:, picks, :]
+            return data
         except Exception:
             if not self.connected:
                 raise RuntimeError(
@@ -433,95 +495,83 @@ class EpochsStream:
                 )
             raise  # pragma: no cover
 
+    def _acquisition_loop(self) -> None:
+        """Acquisition loop running on the dedicated background thread."""
+        stop = self._stop_acquisition
+        while not stop.is_set():
+            self._acquire()
+            if not self.connected:
+                break  # an error occurred and the variables were reset
+            stop.wait(self._acquisition_delay)
+
     def _acquire(self) -> None:
         """Update function looking for new epochs."""
         try:
+            # hoist the attributes used repeatedly in this hot path into locals
+            event_stream = self._event_stream
             if self._stream._n_new_samples == 0 or (
-                self._event_stream is not None
-                and self._event_stream._n_new_samples == 0
+                event_stream is not None and event_stream._n_new_samples == 0
             ):
-                self._submit_acquisition_job()
                 return
+            n_samples_epoch = self._buffer.shape[2]
+            tmin_shift = self._tmin_shift
             # split the different acquisition scenarios to retrieve new events to add to
             # the buffer.
             data, ts = _remove_empty_elements(
                 self._stream._buffer.T, self._stream._timestamps
             )
-            if self._event_stream is None:
-                picks_events = _picks_to_idx(
-                    self._stream._info, self._event_channels, exclude="bads"
-                )
+            if event_stream is None:
                 events = _find_events_in_stim_channels(
-                    data[picks_events, :], self._event_channels, self._info["sfreq"]
+                    data[self._picks_events, :],
+                    self._event_channels,
+                    self._info["sfreq"],
                 )
                 events = _prune_events(
                     events,
-                    self._event_id,
-                    self._buffer.shape[1],
+                    self._event_id_values,
+                    n_samples_epoch,
                     ts,
                     self._last_ts,
                     None,
-                    self._tmin_shift,
-                )
-            elif (
-                self._event_stream is not None
-                and self._event_stream._info["sfreq"] != 0
-            ):
-                picks = _picks_to_idx(
-                    self._event_stream._info,
-                    self._event_channels,
-                    none="all",
-                    exclude=(),
+                    tmin_shift,
                 )
+            elif event_stream is not None and event_stream._info["sfreq"] != 0:
                 data_events, ts_events = _remove_empty_elements(
-                    self._event_stream._buffer[:, picks].T,
-                    self._event_stream._timestamps,
+                    event_stream._buffer[:, self._picks_events].T,
+                    event_stream._timestamps,
                 )
                 events = _find_events_in_stim_channels(
                     data_events, self._event_channels, self._info["sfreq"]
                 )
                 events = _prune_events(
                     events,
-                    self._event_id,
-                    self._buffer.shape[1],
+                    self._event_id_values,
+                    n_samples_epoch,
                     ts,
                     self._last_ts,
                     ts_events,
-                    self._tmin_shift,
+                    tmin_shift,
                 )
-            elif (
-                self._event_stream is not None
-                and self._event_stream._info["sfreq"] == 0
-            ):
+            elif event_stream is not None and event_stream._info["sfreq"] == 0:
                 # don't select only the new events as they might all fall outside of
                 # the attached stream ts buffer, instead always look through all
                 # available events.
-                picks = _picks_to_idx(
-                    self._event_stream._info,
-                    self._event_channels,
-                    none="all",
-                    exclude=(),
-                )
                 data_events, ts_events = _remove_empty_elements(
-                    self._event_stream._buffer[:, picks].T,
-                    self._event_stream._timestamps,
+                    event_stream._buffer[:, self._picks_events].T,
+                    event_stream._timestamps,
                 )
-                events = np.vstack(
-                    [
-                        np.arange(ts_events.size, dtype=np.int64),
-                        np.zeros(ts_events.size, dtype=np.int64),
-                        np.argmax(data_events, axis=0),
-                    ],
-                    dtype=np.int64,
-                ).T
+                events = np.empty((ts_events.size, 3), dtype=np.int64)
+                events[:, 0] = np.arange(ts_events.size)
+                events[:, 1] = 0
+                events[:, 2] = np.argmax(data_events, axis=0)
                 events = _prune_events(
                     events,
                     None,
-                    self._buffer.shape[1],
+                    n_samples_epoch,
                     ts,
                     self._last_ts,
                     ts_events,
-                    self._tmin_shift,
+                    tmin_shift,
                 )
             else:  # pragma: no cover
                 raise RuntimeError(
@@ -529,44 +579,44 @@ class EpochsStream:
                     "developers."
                 )
             if events.shape[0] == 0:  # abort in case we don't have new events to add
-                self._submit_acquisition_job()
                 return
             self._last_ts = ts[events[-1, 0]]
             # select data, for loop is faster than the fancy indexing ideas tried and
-            # will anyway operate on a small number of events most of the time.
-            data_selection = np.empty(
-                (
-                    min(events.shape[0], self._bufsize),
-                    self._buffer.shape[1],
-                    self._picks.size,
-                ),
-                dtype=data.dtype,
+            # will anyway operate on a small number of events most of the time. The
+            # preallocated scratch array is reused across acquisitions to avoid
+            # repeated same-shape allocations on the hot path.
+            data_selection = self._scratch[: min(events.shape[0], self._bufsize)]
+            # hoist the channel selection out of the per-event loop, one gather
+            # instead of one per event; the gather is skipped only if _picks is the
+            # identity, as it can reorder channels even when it selects all of them.
+            data_picked = (
+                data
+                if np.array_equal(self._picks, np.arange(data.shape[0]))
+                else data[self._picks, :]
             )
             for k, start in enumerate(events[:, 0][::-1]):
-                start += self._tmin_shift
-                data_selection[-(k + 1)] = data[
-                    self._picks, start : start + self._buffer.shape[1]
-                ].T
+                start += tmin_shift
+                data_selection[-(k + 1)] = data_picked[
+                    :, start : start + n_samples_epoch
+                ]
             # apply processing
             data_selection = _process_data(
                 data_selection,
-                self._baseline,
+                self._baseline_time,
                 self._reject,
                 self._flat,
-                self._reject_tmin,
-                self._reject_tmax,
+                self._reject_time,
                 self._detrend_type,
-                self._times,
                 self._ch_idx_by_type,
             )
             if data_selection.shape[0] == 0:
-                self._submit_acquisition_job()
                 return
-            # roll buffer and add new epochs
-            self._buffer = np.roll(self._buffer, -events.shape[0], axis=0)
-            self._buffer[-events.shape[0] :, :, :] = data_selection
-            self._buffer_events = np.roll(self._buffer_events, -events.shape[0])
-            self._buffer_events[-events.shape[0] :] = events[:, 2]
+            # write the new epochs at the circular write index instead of rolling the
+            # entire buffer, which would copy every stored epoch on each acquisition.
+            idx = (self._buffer_idx + np.arange(events.shape[0])) % self._bufsize
+            self._buffer[idx] = data_selection
+            self._buffer_events[idx] = events[:, 2]
+            self._buffer_idx = (self._buffer_idx + events.shape[0]) % self._bufsize
             # update the last ts and the number of new epochs
             self._n_new_epochs += events.shape[0]
         except Exception as error:  # pragma: no cover
@@ -574,8 +624,6 @@ class EpochsStream:
             self._reset_variables()
             if os.getenv("MNE_LSL_RAISE_STREAM_ERRORS", "false").lower() == "true":
                 raise error
-        else:
-            self._submit_acquisition_job()
 
     def _check_connected(self, name: str) -> None:
         """Check that the epochs stream is connected before calling 'name'."""
@@ -589,26 +637,23 @@ class EpochsStream:
     def _reset_variables(self):
         """Reset variables defined after connection."""
         self._acquisition_delay = None
+        self._acquisition_thread = None
+        self._baseline_time = None
         self._buffer = None
         self._buffer_events = None
+        self._buffer_idx = 0
         self._ch_idx_by_type = None
-        self._executor = None
+        self._event_id_values = None
         self._info = None
         self._last_ts = None
         self._n_new_epochs = 0
         self._picks = None
+        self._picks_events = None
+        self._reject_time = None
+        self._scratch = None
+        self._stop_acquisition = None
         self._tmin_shift = None
 
-    def _submit_acquisition_job(self) -> None:
-        """Submit a new acquisition job, if applicable."""
-        if self._executor is None:
-            return  # either shutdown or manual acquisition
-        high_precision_sleep(self._acquisition_delay)
-        try:
-            self._executor.submit(self._acquire)
-        except RuntimeError:  # pragma: no cover
-            pass  # shutdown
-
     # ----------------------------------------------------------------------------------
     @property
     def connected(self) -> bool:
@@ -639,7 +684,11 @@ class EpochsStream:
         :type: :class:`numpy.ndarray`
         """
         self._check_connected("events")
-        return self._buffer_events
+        # reorder the circular buffer, oldest to newest
+        idx = (
+            self._buffer_idx + np.arange(self._buffer_events.size)
+        ) % self._buffer_events.size
+        return self._buffer_events[idx]
 
     @property
     def info(self) -> Info:
@@ -907,12 +956,14 @@ def _find_events_in_stim_channels(
         events_list.append(events)
     events = np.concatenate(events_list, axis=0)
     events = _find_unique_events(events)
-    return events[np.argsort(events[:, 0])]
+    # the per-channel events are sorted, thus the concatenation is a set of sorted
+    # runs on which a stable sort runs close to linear time
+    return events[np.argsort(events[:, 0], kind="stable")]
 
 
 def _prune_events(
     events: NDArray[np.int64],
-    event_id: dict[str, int] | None,
+    event_id: NDArray[np.int64] | None,
     buffer_size: int,
     ts: NDArray[np.float64],
     last_ts: float | None,
@@ -920,61 +971,49 @@ def _prune_events(
     tmin_shift: float,
 ) -> NDArray[np.int64]:
     """Prune events based on criteria and buffer size."""
-    # remove events outside of the event_id dictionary
+    if events.shape[0] == 0:  # common case in a tight acquisition loop
+        return events
+    # remove events outside of the selected event IDs
     if event_id is not None:
-        sel = np.isin(events[:, 2], list(event_id.values()))
+        sel = np.isin(events[:, 2], event_id)
         events = events[sel]
     # get the events position in the stream times after removing events outside of ts
     if ts_events is not None:
-        sel = np.where(
-            (ts[0] <= ts_events[events[:, 0]]) & (ts_events[events[:, 0]] <= ts[-1])
-        )[0]
+        # gather the event timestamps once, events[:, 0] is sorted ascending thus the
+        # needle handed to searchsorted is sorted as well, its fastest path.
+        ts_at_events = ts_events[events[:, 0]]
+        sel = (ts[0] <= ts_at_events) & (ts_at_events <= ts[-1])
         events = events[sel]
-        events[:, 0] = np.searchsorted(ts, ts_events[events[:, 0]], side="left")
-    sel = np.where(0 <= events[:, 0] + tmin_shift)[0]
+        events[:, 0] = np.searchsorted(ts, ts_at_events[sel], side="left")
     # remove events which can't fit an entire epoch and/or are outside of the buffer
-    sel = np.where(
-        (0 <= events[:, 0] + tmin_shift)
-        & (events[:, 0] + tmin_shift + buffer_size <= ts.size)
-    )[0]
-    events = events[sel]
+    start = events[:, 0] + tmin_shift
+    events = events[(0 <= start) & (start + buffer_size <= ts.size)]
     # remove events which have already been moved to the buffer
     if last_ts is not None:
-        sel = np.where(ts[events[:, 0]] > last_ts)[0]
-        events = events[sel]
+        events = events[ts[events[:, 0]] > last_ts]
     return events
 
 
 def _process_data(
-    data: ScalarArray,  # array of shape (n_epochs, n_samples, n_channels)
-    baseline: tuple[float | None, float | None] | None,
+    data: ScalarArray,  # array of shape (n_epochs, n_channels, n_samples)
+    baseline_time: slice | None,
     reject: dict[str, float] | None,
     flat: dict[str, float] | None,
-    reject_tmin: float | None,
-    reject_tmax: float | None,
+    reject_time: slice,
     detrend_type: str | None,
-    times: NDArray[np.float64],
     ch_idx_by_type: dict[str, list[int]],
 ) -> ScalarArray:
-    """Apply the requested processing to the new epochs."""
+    """Apply the requested processing to the new epochs.
+
+    The baseline and rejection time windows are resolved into sample slices at
+    connection time.
+    """
     # start by PTP rejection to limit the number of epochs to baseline and detrend
     if reject is not None or flat is not None:
-        # figure out the slice of indices to use for rejection
-        if reject_tmin is None:
-            reject_imin = None
-        else:
-            idx = np.nonzero(reject_tmin <= times)[0]
-            reject_imin = idx[0]
-        if reject_tmax is None:
-            reject_imax = None
-        else:
-            idx = np.nonzero(times <= reject_tmax)[0]
-            reject_imax = idx[-1]
-        reject_time = slice(reject_imin, reject_imax)
-        data_ptp = data[:, reject_time, :]
-        if data_ptp.shape[1] != 0:  # check that the slice is not empty
-            ptp = np.max(data[:, reject_time, :], axis=1) - np.min(
-                data[:, reject_time, :], axis=1
+        data_ptp = data[:, :, reject_time]
+        if data_ptp.shape[2] != 0:  # check that the slice is not empty
+            ptp = np.max(data[:, :, reject_time], axis=2) - np.min(
+                data[:, :, reject_time], axis=2
             )  # shape (n_epochs, n_channels)
             if reject is not None:
                 for ch_type, threshold in reject.items():
@@ -1002,21 +1041,10 @@ def _process_data(
     if data.shape[0] == 0:
         return data
     # next apply baseline correction
-    if baseline is not None:
-        if baseline[0] is None:
-            baseline_imin = None
-        else:
-            idx = np.nonzero(baseline[0] <= times)[0]
-            baseline_imin = idx[0]
-        if baseline[1] is None:
-            baseline_imax = None
-        else:
-            idx = np.nonzero(times <= baseline[1])[0]
-            baseline_imax = idx[-1]
-        baseline_time = slice(baseline_imin, baseline_imax)
-        data_baseline = data[:, baseline_time, :]
-        if data_baseline.shape[1] != 0:
-            data -= np.mean(data[:, baseline_time, :], axis=1, keepdims=True)
+    if baseline_time is not None:
+        data_baseline = data[:, :, baseline_time]
+        if data_baseline.shape[2] != 0:
+            data -= np.mean(data[:, :, baseline_time], axis=2, keepdims=True)
         else:
             warn(
                 "The baseline time window defined with 'baseline', 'tmin' and 'tmax' "
@@ -1024,7 +1052,7 @@ def _process_data(
             )
     # finally detrend the data
     if detrend_type is not None:
-        data = detrend(data, axis=1, type=detrend_type, overwrite_data=True)
+        data = detrend(data, axis=2, type=detrend_type, overwrite_data=True)
     return data
 
 
@@ -10,7 +10,6 @@ from ..utils._checks import check_value as check_value
 from ..utils._checks import ensure_int as ensure_int
 from ..utils._docs import fill_doc as fill_doc
 from ..utils._fixes import find_events as find_events
-from ..utils._time import high_precision_sleep as high_precision_sleep
 from ..utils.logs import logger as logger
 from ..utils.logs import warn as warn
 from .base import BaseStream as BaseStream
@@ -225,9 +224,15 @@ class EpochsStream:
     _info: Incomplete
     _tmin_shift: Incomplete
     _ch_idx_by_type: Incomplete
+    _baseline_time: Incomplete
+    _reject_time: Incomplete
+    _picks_events: Incomplete
+    _event_id_values: Incomplete
     _buffer: Incomplete
     _buffer_events: Incomplete
-    _executor: Incomplete
+    _scratch: Incomplete
+    _stop_acquisition: Incomplete
+    _acquisition_thread: Incomplete
 
     def connect(self, acquisition_delay: float | None = 0.001) -> EpochsStream:
         """Start acquisition of epochs from the connected Stream.
@@ -263,6 +268,7 @@ class EpochsStream:
         """
     _n_new_epochs: int
 
+    @fill_doc
     def get_data(
         self,
         n_epochs: int | None = None,
@@ -282,9 +288,9 @@ class EpochsStream:
             'eeg']``) will pick channels of those types, channel *name* strings (e.g.,
             ``['MEG0111', 'MEG2623']`` will pick the given channels. Can also be the
             string values ``'all'`` to pick all channels, or ``'data'`` to pick
-            :term:`data channels`. None (default) will pick all channels. Note that
-            channels in ``info['bads']`` *will be included* if their names or indices
-            are explicitly provided.
+            :term:`data channels`. None (default) will pick all channels. Bad channels
+            are included by default. Note that channels in ``info['bads']`` *will be
+            included* if their names or indices are explicitly provided.
         exclude : str | list of str | tuple of str
             Set of channels to exclude, only used when picking based on types (e.g.,
             ``exclude="bads"`` when ``picks="meg"``) or when picking is set to ``None``.
@@ -300,7 +306,11 @@ class EpochsStream:
         is reset at every function call, even if all channels were not selected with the
         argument ``picks``.
         """
+
+    def _acquisition_loop(self) -> None:
+        """Acquisition loop running on the dedicated background thread."""
     _last_ts: Incomplete
+    _buffer_idx: Incomplete
 
     def _acquire(self) -> None:
         """Update function looking for new epochs."""
@@ -311,9 +321,6 @@ class EpochsStream:
     def _reset_variables(self) -> None:
         """Reset variables defined after connection."""
 
-    def _submit_acquisition_job(self) -> None:
-        """Submit a new acquisition job, if applicable."""
-
     @property
     def connected(self) -> bool:
         """Connection status of the :class:`~mne_lsl.stream.EpochsStream`.
@@ -400,7 +407,7 @@ def _find_events_in_stim_channels(
 
 def _prune_events(
     events: NDArray[np.int64],
-    event_id: dict[str, int] | None,
+    event_id: NDArray[np.int64] | None,
     buffer_size: int,
     ts: NDArray[np.float64],
     last_ts: float | None,
@@ -411,16 +418,18 @@ def _prune_events(
 
 def _process_data(
     data: ScalarArray,
-    baseline: tuple[float | None, float | None] | None,
+    baseline_time: slice | None,
     reject: dict[str, float] | None,
     flat: dict[str, float] | None,
-    reject_tmin: float | None,
-    reject_tmax: float | None,
+    reject_time: slice,
     detrend_type: str | None,
-    times: NDArray[np.float64],
     ch_idx_by_type: dict[str, list[int]],
 ) -> ScalarArray:
-    """Apply the requested processing to the new epochs."""
+    """Apply the requested processing to the new epochs.
+
+    The baseline and rejection time windows are resolved into sample slices at
+    connection time.
+    """
 
 def _remove_empty_elements(
     data: ScalarArray, ts: NDArray[np.float64]
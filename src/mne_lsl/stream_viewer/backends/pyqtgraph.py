@@ -173,24 +173,23 @@ class _BackendPyQtGraph(_Backend):
     def _update_loop(self):
         super()._update_loop()
 
-        if len(self._scope.ts_list) > 0:
+        n_new_samples = len(self._scope.ts_list)
+        if n_new_samples > 0:
+            # slice the plotting window once and share the view between channels
+            window = self._scope.data_buffer[:, -self._duration_plot_samples :]
             for k, idx in enumerate(self._scope.selected_channels):
                 self._plots[idx].setData(
                     x=self._x_arr,
-                    y=self._scope.data_buffer[idx, -self._duration_plot_samples :]
-                    + self._offset[k],
+                    y=window[idx] + self._offset[k],
                 )
 
             # Update existing events position
             for event in self._trigger_events:
                 event.position_buffer = (
-                    event.position_buffer
-                    - len(self._scope.ts_list) / self._scope.sample_rate
+                    event.position_buffer - n_new_samples / self._scope.sample_rate
                 )
             # Add new events entering the buffer
-            self._update_LPT_trigger_events(
-                self._scope.trigger_buffer[-len(self._scope.ts_list) :]
-            )
+            self._update_LPT_trigger_events(self._scope.trigger_buffer[-n_new_samples:])
             # Hide/Remove events exiting window and buffer
             self._clean_up_trigger_events()
 
@@ -207,39 +207,39 @@ def events() -> NDArray[np.int64]:
 def test_prune_events(events: NDArray[np.int64]):
     """Test pruning events."""
     ts = np.arange(10000, 11000, 1.8)
-    events_ = _prune_events(events, dict(a=1, b=2, c=3), 10, ts, None, None, 0)
+    events_ = _prune_events(events, np.array([1, 2, 3]), 10, ts, None, None, 0)
     assert_allclose(events_, events)
     # test pruning events outside of the event_id dictionary
-    events_ = _prune_events(events, dict(a=1, c=3), 10, ts, None, None, 0)
+    events_ = _prune_events(events, np.array([1, 3]), 10, ts, None, None, 0)
     assert sorted(np.unique(events_[:, 2])) == [1, 3]
     # test pruning events that can't fit in the buffer
     ts = np.arange(5)
-    events_ = _prune_events(events, dict(a=1, b=2, c=3), 10, ts, None, None, 0)
+    events_ = _prune_events(events, np.array([1, 2, 3]), 10, ts, None, None, 0)
     assert events_.size == 0
     ts = np.arange(10000, 11000, 1.8)  # ts.size == 556
-    events_ = _prune_events(events, dict(a=1, b=2, c=3), 500, ts, None, None, 0)
+    events_ = _prune_events(events, np.array([1, 2, 3]), 500, ts, None, None, 0)
     assert events_[-1, 0] + 500 <= ts.size
     assert events_[-1, 0] == 50  # events @ 60, 70, 80, ... should be dropped
     # test fitting in the buffer with tmin
     ts = np.arange(15)
-    events_ = _prune_events(events, dict(a=1, b=2, c=3), 10, ts, None, None, -7)
+    events_ = _prune_events(events, np.array([1, 2, 3]), 10, ts, None, None, -7)
     assert events_.shape[0] == 1
     assert events_[0, 0] == 10  # event @ 10 should be kept
-    events_ = _prune_events(events, dict(a=1, b=2, c=3), 10, ts, None, None, -12)
+    events_ = _prune_events(events, np.array([1, 2, 3]), 10, ts, None, None, -12)
     assert events_.shape[0] == 0
-    events_ = _prune_events(events, dict(a=1, b=2, c=3), 10, ts, None, None, -16)
+    events_ = _prune_events(events, np.array([1, 2, 3]), 10, ts, None, None, -16)
     assert events_.shape[0] == 1
     assert events_[0, 0] == 20  # event @ 20 should be kept
     # test pruning events that have already been moved to the buffer
     ts = np.arange(10000, 11000, 1.8)  # ts.size == 556
     events_ = _prune_events(
-        events, dict(a=1, b=2, c=3), 10, ts, ts[events[3, 0]], None, 0
+        events, np.array([1, 2, 3]), 10, ts, ts[events[3, 0]], None, 0
     )
     assert_allclose(events_, events[4:, :])
     # test pruning events from an event stream, which converts the index to index in ts
     ts = np.arange(1000)
     ts_events = np.arange(500) * 2 + 0.5  # mock a different sampling frequency
-    events_ = _prune_events(events, dict(a=1, b=2, c=3), 10, ts, None, ts_events, 0)
+    events_ = _prune_events(events, np.array([1, 2, 3]), 10, ts, None, ts_events, 0)
     assert_allclose(events_[:, 2], events[:, 2])
     # with the half sampling rate + 0.5 set above, we should be selecting:
     # from: 10, 20, 30, 40, ... corresponding to 20.5, 40.5, 60.5, ...
@@ -422,7 +422,7 @@ def test_epochs_without_event_stream_manual_acquisition(mock_lsl_stream):
 @pytest.fixture
 def data_ones() -> tuple[NDArray[np.float64], NDArray[np.float64]]:
     """Data array used for baseline correction test."""
-    data = np.ones((2, 100, 5), dtype=np.float64)
+    data = np.ones((2, 5, 100), dtype=np.float64)
     times = np.arange(100, dtype=np.float64)
     return data, times
 
@@ -433,13 +433,11 @@ def test_process_data_no_baseline(
     """Test processing data without baseline correction."""
     data = _process_data(
         data_ones[0],
-        baseline=None,
+        baseline_time=None,
         reject=None,
         flat=None,
-        reject_tmin=None,
-        reject_tmax=None,
+        reject_time=slice(None, None),
         detrend_type=None,
-        times=data_ones[1],
         ch_idx_by_type=dict(),
     )
     assert_allclose(data, data_ones[0])
@@ -451,13 +449,11 @@ def test_process_data_baseline_all_segment(
     """Test processing data with baseline correction on the entire segment."""
     data = _process_data(
         data_ones[0].copy(),
-        baseline=(None, None),
+        baseline_time=slice(None, None),
         reject=None,
         flat=None,
-        reject_tmin=None,
-        reject_tmax=None,
+        reject_time=slice(None, None),
         detrend_type=None,
-        times=data_ones[1],
         ch_idx_by_type=dict(),
     )
     assert_allclose(data, np.zeros(data.shape))
@@ -467,40 +463,36 @@ def test_process_data_baseline_start_segment(
     data_ones: tuple[NDArray[np.float64], NDArray[np.float64]],
 ):
     """Test processing data with baseline correction on the start segment."""
-    data_ones[0][:, 10:, :] = 101
+    data_ones[0][:, :, 10:] = 101
     data = _process_data(
         data_ones[0].copy(),
-        baseline=(None, 10),
+        baseline_time=slice(None, 10),
         reject=None,
         flat=None,
-        reject_tmin=None,
-        reject_tmax=None,
+        reject_time=slice(None, None),
         detrend_type=None,
-        times=data_ones[1],
         ch_idx_by_type=dict(),
     )
-    assert_allclose(data[:, :10, :], np.zeros((2, 10, 5)))
-    assert_allclose(data[:, 10:, :], np.ones((2, 90, 5)) * 100)
+    assert_allclose(data[:, :, :10], np.zeros((2, 5, 10)))
+    assert_allclose(data[:, :, 10:], np.ones((2, 5, 90)) * 100)
 
 
 def test_process_data_baseline_end_segment(
     data_ones: tuple[NDArray[np.float64], NDArray[np.float64]],
 ):
     """Test processing data with baseline correction on the end segment."""
-    data_ones[0][:, :90, :] = 101
+    data_ones[0][:, :, :90] = 101
     data = _process_data(
         data_ones[0].copy(),
-        baseline=(90, None),
+        baseline_time=slice(90, None),
         reject=None,
         flat=None,
-        reject_tmin=None,
-        reject_tmax=None,
+        reject_time=slice(None, None),
         detrend_type=None,
-        times=data_ones[1],
         ch_idx_by_type=dict(),
     )
-    assert_allclose(data[:, 90:, :], np.zeros((2, 10, 5)))
-    assert_allclose(data[:, :90, :], np.ones((2, 90, 5)) * 100)
+    assert_allclose(data[:, :, 90:], np.zeros((2, 5, 10)))
+    assert_allclose(data[:, :, :90], np.ones((2, 5, 90)) * 100)
 
 
 def test_process_data_detrend_constant(
@@ -509,26 +501,22 @@ def test_process_data_detrend_constant(
     """Test constant (DC) detrending."""
     data = _process_data(
         data_ones[0],
-        baseline=None,
+        baseline_time=None,
         reject=None,
         flat=None,
-        reject_tmin=None,
-        reject_tmax=None,
+        reject_time=slice(None, None),
         detrend_type=None,
-        times=data_ones[1],
         ch_idx_by_type=dict(),
     )
     assert_allclose(data, data_ones[0])
 
     data = _process_data(
         data_ones[0],
-        baseline=None,
+        baseline_time=None,
         reject=None,
         flat=None,
-        reject_tmin=None,
-        reject_tmax=None,
+        reject_time=slice(None, None),
         detrend_type="constant",
-        times=data_ones[1],
         ch_idx_by_type=dict(),
     )
     assert_allclose(data, np.zeros(data.shape))
@@ -538,10 +526,10 @@ def test_process_data_detrend_constant(
 def data_detrend_linear() -> tuple[NDArray[np.float64], NDArray[np.float64]]:
     """Data array used for detrending test."""
     data = [
-        np.arange(100 * k, 100 * (k + 1), dtype=np.float64).reshape(1, 100, 1)
+        np.arange(100 * k, 100 * (k + 1), dtype=np.float64).reshape(1, 1, 100)
         for k in range(3)
     ]
-    data = np.concatenate(data, axis=-1)
+    data = np.concatenate(data, axis=1)
     data = np.concatenate([data, data * 2], axis=0)
     times = np.arange(100, dtype=np.float64)
     return data, times
@@ -553,26 +541,22 @@ def test_process_data_detrend_linear(
     """Test linear detrending."""
     data = _process_data(
         data_detrend_linear[0],
-        baseline=None,
+        baseline_time=None,
         reject=None,
         flat=None,
-        reject_tmin=None,
-        reject_tmax=None,
+        reject_time=slice(None, None),
         detrend_type=None,
-        times=data_detrend_linear[1],
         ch_idx_by_type=dict(),
     )
     assert_allclose(data, data_detrend_linear[0])
 
     data = _process_data(
         data_detrend_linear[0],
-        baseline=None,
+        baseline_time=None,
         reject=None,
         flat=None,
-        reject_tmin=None,
-        reject_tmax=None,
+        reject_time=slice(None, None),
         detrend_type="linear",
-        times=data_detrend_linear[1],
         ch_idx_by_type=dict(),
     )
     assert_allclose(data, np.zeros(data.shape), atol=1e-6)
@@ -582,13 +566,11 @@ def test_process_data_flat(data_ones: tuple[NDArray[np.float64], NDArray[np.floa
     """Test rejection of epochs due to flatness."""
     data = _process_data(
         data_ones[0],
-        baseline=None,
+        baseline_time=None,
         reject=None,
         flat=dict(eeg=1),
-        reject_tmin=None,
-        reject_tmax=None,
+        reject_time=slice(None, None),
         detrend_type=None,
-        times=data_ones[1],
         ch_idx_by_type=dict(eeg=[0, 1]),
     )
     assert data.shape[0] == 0
@@ -597,9 +579,9 @@ def test_process_data_flat(data_ones: tuple[NDArray[np.float64], NDArray[np.floa
 @pytest.fixture
 def data_reject():
     """Data array used for rejection test."""
-    data = np.ones((2, 100, 5), dtype=np.float64)
-    data[0, ::2, :] = 2
-    data[1, ::2, :] = 101
+    data = np.ones((2, 5, 100), dtype=np.float64)
+    data[0, :, ::2] = 2
+    data[1, :, ::2] = 101
     times = np.arange(100, dtype=np.float64)
     return data, times
 
@@ -611,39 +593,33 @@ def test_process_data_reject(
     assert data_reject[0].shape[0] == 2
     data = _process_data(
         data_reject[0].copy(),
-        baseline=None,
+        baseline_time=None,
         reject=dict(eeg=50),
         flat=None,
-        reject_tmin=None,
-        reject_tmax=None,
+        reject_time=slice(None, None),
         detrend_type=None,
-        times=data_reject[1],
         ch_idx_by_type=dict(eeg=[0, 1]),
     )
     assert data.shape[0] == 1
 
     data = _process_data(
         data_reject[0].copy(),
-        baseline=None,
+        baseline_time=None,
         reject=dict(eeg=500),
         flat=None,
-        reject_tmin=None,
-        reject_tmax=None,
+        reject_time=slice(None, None),
         detrend_type=None,
-        times=data_reject[1],
         ch_idx_by_type=dict(eeg=[0, 1]),
     )
     assert data.shape[0] == 2
 
     data = _process_data(
         data_reject[0].copy(),
-        baseline=None,
+        baseline_time=None,
         reject=dict(eeg=1e-3),
         flat=None,
-        reject_tmin=None,
-        reject_tmax=None,
+        reject_time=slice(None, None),
         detrend_type=None,
-        times=data_reject[1],
         ch_idx_by_type=dict(eeg=[0, 1]),
     )
     assert data.shape[0] == 0
@@ -652,9 +628,9 @@ def test_process_data_reject(
 @pytest.fixture
 def data_reject_tmin_tmax():
     """Data array used for rejection based on segment test."""
-    data = np.ones((2, 100, 5), dtype=np.float64)
-    data[0, 10::2, :] = 2
-    data[1, 10::2, :] = 101
+    data = np.ones((2, 5, 100), dtype=np.float64)
+    data[0, :, 10::2] = 2
+    data[1, :, 10::2] = 101
     times = np.arange(100, dtype=np.float64)
     return data, times
 
@@ -666,13 +642,11 @@ def test_process_data_reject_tmin_tmax(
     assert data_reject_tmin_tmax[0].shape[0] == 2
     data = _process_data(
         data_reject_tmin_tmax[0].copy(),
-        baseline=None,
+        baseline_time=None,
         reject=dict(eeg=50),
         flat=None,
-        reject_tmin=0,
-        reject_tmax=10,
+        reject_time=slice(0, 10),
         detrend_type=None,
-        times=data_reject_tmin_tmax[1],
         ch_idx_by_type=dict(eeg=[0, 1]),
     )
     assert data.shape[0] == 2
@@ -680,13 +654,11 @@ def test_process_data_reject_tmin_tmax(
     assert data_reject_tmin_tmax[0].shape[0] == 2
     data = _process_data(
         data_reject_tmin_tmax[0].copy(),
-        baseline=None,
+        baseline_time=None,
         reject=dict(eeg=50),
         flat=None,
-        reject_tmin=10,
-        reject_tmax=25,
+        reject_time=slice(10, 25),
         detrend_type=None,
-        times=data_reject_tmin_tmax[1],
         ch_idx_by_type=dict(eeg=[0, 1]),
     )
     assert data.shape[0] == 1